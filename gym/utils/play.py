@@ -65,7 +65,7 @@ class PlayableGame:
 
     def _get_relevant_keys(
         self, keys_to_action: Optional[Dict[Tuple[int], int]] = None
-    ) -> set:
+    ) -> frozenset:
         if keys_to_action is None:
             if hasattr(self.env, "get_keys_to_action"):
                 keys_to_action = self.env.get_keys_to_action()
@@ -77,8 +77,9 @@ class PlayableGame:
                     "please specify one manually"
                 )
         assert isinstance(keys_to_action, dict)
-        relevant_keys = set(sum((list(k) for k in keys_to_action.keys()), []))
-        return relevant_keys
+        return frozenset(
+            key for key_combination in keys_to_action for key in key_combination
+        )
 
     def _get_video_size(self, zoom: Optional[float] = None) -> Tuple[int, int]:
         rendered = self.env.render()
@@ -103,11 +104,12 @@ class PlayableGame:
         """
         if event.type == pygame.KEYDOWN:
             if event.key in self.relevant_keys:
-                self.pressed_keys.append(event.key)
+                if event.key not in self.pressed_keys:
+                    self.pressed_keys.append(event.key)
             elif event.key == pygame.K_ESCAPE:
                 self.running = False
         elif event.type == pygame.KEYUP:
-            if event.key in self.relevant_keys:
+            if event.key in self.pressed_keys:
                 self.pressed_keys.remove(event.key)
         elif event.type == pygame.QUIT:
             self.running = False
@@ -237,6 +239,12 @@ def play(
             sorted(ord(key) if isinstance(key, str) else key for key in key_combination)
         )
         key_code_to_action[key_code] = action
+    # A single pressed key is looked up directly, without building a sorted tuple of the pressed keys
+    single_key_to_action = {
+        key_code[0]: action
+        for key_code, action in key_code_to_action.items()
+        if len(key_code) == 1
+    }
 
     game = PlayableGame(env, key_code_to_action, zoom)
 
@@ -251,7 +259,10 @@ def play(
             done = False
             obs = env.reset(seed=seed)
         else:
-            action = key_code_to_action.get(tuple(sorted(game.pressed_keys)), noop)
+            if len(game.pressed_keys) == 1:
+                action = single_key_to_action.get(game.pressed_keys[0], noop)
+            else:
+                action = key_code_to_action.get(tuple(sorted(game.pressed_keys)), noop)
             prev_obs = obs
             obs, rew, terminated, truncated, info = env.step(action)
             done = terminated or truncated
@@ -3,7 +3,9 @@ import multiprocessing as mp
 import sys
 import time
 from copy import deepcopy
+from ctypes import c_bool
 from enum import Enum
+from multiprocessing import connection
 from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
@@ -25,6 +27,7 @@ from gym.vector.utils import (
     create_shared_memory,
     iterate,
     read_from_shared_memory,
+    take,
     write_to_shared_memory,
 )
 from gym.vector.vector_env import VectorEnv
@@ -66,6 +69,7 @@ class AsyncVectorEnv(VectorEnv):
         context: Optional[str] = None,
         daemon: bool = True,
         worker: Optional[callable] = None,
+        num_workers: Optional[int] = None,
     ):
         """Vectorized environment that runs multiple environments in parallel.
 
@@ -77,6 +81,10 @@ class AsyncVectorEnv(VectorEnv):
                 then the action space of the first environment is taken.
             shared_memory: If ``True``, then the observations from the worker processes are communicated back through
                 shared variables. This can improve the efficiency if the observations are large (e.g. images).
+                With the default worker, the actions are also sent, and the rewards, terminations and truncations
+                sent back, through shared variables, so that only the commands and the info dictionaries are
+                sent through the pipes. Only discrete actions (``Discrete``, ``MultiDiscrete`` and ``MultiBinary``)
+                are shared, other actions are still sent through the pipes.
             copy: If ``True``, then the :meth:`~AsyncVectorEnv.reset` and :meth:`~AsyncVectorEnv.step` methods
                 return a copy of the observations.
             context: Context for `multiprocessing`_. If ``None``, then the default context is used.
@@ -85,6 +93,10 @@ class AsyncVectorEnv(VectorEnv):
                 so for some environments you may want to have it set to ``False``.
             worker: If set, then use that worker in a subprocess instead of a default one.
                 Can be useful to override some inner vector env logic, for instance, how resets on termination or truncation are handled.
+            num_workers: Number of worker processes. If ``None``, then each sub-environment runs in its own process.
+                Otherwise, the sub-environments are split into ``num_workers`` contiguous groups, and each process
+                steps its group of sub-environments sequentially, so that the communication with the main process
+                happens once per group instead of once per sub-environment.
 
         Warnings: worker is an advanced mode option. It provides a high degree of flexibility and a high chance
             to shoot yourself in the foot; thus, if you are writing your own worker, it is recommended to start
@@ -95,6 +107,8 @@ class AsyncVectorEnv(VectorEnv):
                 (or, by default, the observation space of the first sub-environment).
             ValueError: If observation_space is a custom space (i.e. not a default space in Gym,
                 such as gym.spaces.Box, gym.spaces.Discrete, or gym.spaces.Dict) and shared_memory is True.
+            ValueError: If num_workers is not between 1 and the number of sub-environments, or if it is used
+                together with a custom worker.
         """
         ctx = mp.get_context(context)
         self.env_fns = env_fns
@@ -114,6 +128,24 @@ class AsyncVectorEnv(VectorEnv):
             action_space=action_space,
         )
 
+        self._grouped = num_workers is not None
+        if self._grouped:
+            if not 1 <= num_workers <= self.num_envs:
+                raise ValueError(
+                    f"Expected `num_workers` to be between 1 and the number of environments ({self.num_envs}), "
+                    f"actual value: {num_workers}"
+                )
+            if worker is not None:
+                raise ValueError(
+                    "A custom `worker` cannot be used together with `num_workers`."
+                )
+            self._worker_env_indices = [
+                indices.tolist()
+                for indices in np.array_split(np.arange(self.num_envs), num_workers)
+            ]
+        else:
+            self._worker_env_indices = [[i] for i in range(self.num_envs)]
+
         if self.shared_memory:
             try:
                 _obs_buffer = create_shared_memory(
@@ -137,24 +169,69 @@ class AsyncVectorEnv(VectorEnv):
                 self.single_observation_space, n=self.num_envs, fn=np.zeros
             )
 
+        # A custom worker is not expected to know about the step buffers, so the actions, rewards,
+        # terminations and truncations are only shared with the default shared memory worker.
+        worker_kwargs = {}
+        self._step_buffers, self._action_buffer = None, None
+        if self.shared_memory and worker is None:
+            self._step_buffers = (
+                ctx.Array("d", self.num_envs),
+                ctx.Array(c_bool, self.num_envs),
+                ctx.Array(c_bool, self.num_envs),
+            )
+            worker_kwargs["step_buffers"] = self._step_buffers
+            self._rewards, self._terminateds, self._truncateds = _read_step_buffers(
+                self._step_buffers
+            )
+            # Only discrete actions can be shared, integer actions in the space are then written without loss
+            if isinstance(
+                self.single_action_space,
+                (
+                    gym.spaces.Discrete,
+                    gym.spaces.MultiDiscrete,
+                    gym.spaces.MultiBinary,
+                ),
+            ):
+                self._action_buffer = create_shared_memory(
+                    self.single_action_space, n=self.num_envs, ctx=ctx
+                )
+                self._actions = read_from_shared_memory(
+                    self.single_action_space, self._action_buffer, n=self.num_envs
+                )
+                worker_kwargs["action_buffer"] = self._action_buffer
+                worker_kwargs["num_envs"] = self.num_envs
+        else:
+            self._rewards = np.zeros((self.num_envs,), dtype=np.float64)
+            self._terminateds = np.zeros((self.num_envs,), dtype=np.bool_)
+            self._truncateds = np.zeros((self.num_envs,), dtype=np.bool_)
+
         self.parent_pipes, self.processes = [], []
         self.error_queue = ctx.Queue()
-        target = _worker_shared_memory if self.shared_memory else _worker
-        target = worker or target
+        if self._grouped:
+            target = _worker_group
+        else:
+            target = _worker_shared_memory if self.shared_memory else _worker
+            target = worker or target
         with clear_mpi_env_vars():
-            for idx, env_fn in enumerate(self.env_fns):
+            for idx, env_indices in enumerate(self._worker_env_indices):
                 parent_pipe, child_pipe = ctx.Pipe()
+                if self._grouped:
+                    env_fn = [CloudpickleWrapper(env_fns[i]) for i in env_indices]
+                    worker_kwargs["env_indices"] = env_indices
+                else:
+                    env_fn = CloudpickleWrapper(env_fns[env_indices[0]])
                 process = ctx.Process(
                     target=target,
                     name=f"Worker<{type(self).__name__}>-{idx}",
                     args=(
                         idx,
-                        CloudpickleWrapper(env_fn),
+                        env_fn,
                         child_pipe,
                         parent_pipe,
                         _obs_buffer,
                         self.error_queue,
                     ),
+                    kwargs=dict(worker_kwargs),
                 )
 
                 self.parent_pipes.append(parent_pipe)
@@ -165,6 +242,8 @@ class AsyncVectorEnv(VectorEnv):
                 child_pipe.close()
 
         self._state = AsyncState.DEFAULT
+        self._pending_env_ids, self._partial_step = [], False
+        self._batch_observations = {}
         self._check_spaces()
 
     def reset_async(
@@ -200,14 +279,16 @@ class AsyncVectorEnv(VectorEnv):
                 self._state.value,
             )
 
-        for pipe, single_seed in zip(self.parent_pipes, seed):
+        reset_kwargs = []
+        for single_seed in seed:
             single_kwargs = {}
             if single_seed is not None:
                 single_kwargs["seed"] = single_seed
             if options is not None:
                 single_kwargs["options"] = options
+            reset_kwargs.append(single_kwargs)
 
-            pipe.send(("reset", single_kwargs))
+        self._send_to_workers("reset", reset_kwargs)
         self._state = AsyncState.WAITING_RESET
 
     def reset_wait(
@@ -244,7 +325,7 @@ class AsyncVectorEnv(VectorEnv):
                 f"The call to `reset_wait` has timed out after {timeout} second(s)."
             )
 
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        results, successes = self._recv_from_workers()
         self._raise_if_errors(successes)
         self._state = AsyncState.DEFAULT
 
@@ -260,11 +341,14 @@ class AsyncVectorEnv(VectorEnv):
 
         return (deepcopy(self.observations) if self.copy else self.observations), infos
 
-    def step_async(self, actions: np.ndarray):
+    def step_async(self, actions: np.ndarray, env_ids: Optional[Sequence[int]] = None):
         """Send the calls to :obj:`step` to each sub-environment.
 
         Args:
             actions: Batch of actions. element of :attr:`~VectorEnv.action_space`
+            env_ids: Indices of the sub-environments to step, with one action in ``actions`` for each of them.
+                If ``None``, then all the sub-environments are stepped. Sub-environments can be stepped while
+                others are still pending, as long as they are not pending themselves.
 
         Raises:
             ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
@@ -272,26 +356,84 @@ class AsyncVectorEnv(VectorEnv):
                 method (e.g. :meth:`reset_async`). This can be caused by two consecutive
                 calls to :meth:`step_async`, with no call to :meth:`step_wait` in
                 between.
+            ValueError: If ``env_ids`` is used with ``num_workers``, contains duplicate or out of range indices,
+                or if the number of actions does not match the number of sub-environments to step.
         """
         self._assert_is_running()
-        if self._state != AsyncState.DEFAULT:
+        if env_ids is not None and self._grouped:
+            raise ValueError(
+                "Stepping a subset of the environments with `env_ids` is not supported with `num_workers`."
+            )
+        if env_ids is None:
+            env_ids = list(range(self.num_envs))
+        else:
+            env_ids = [int(env_id) for env_id in env_ids]
+            if len(set(env_ids)) != len(env_ids) or not all(
+                0 <= env_id < self.num_envs for env_id in env_ids
+            ):
+                raise ValueError(
+                    f"Expected `env_ids` to be unique indices between 0 and {self.num_envs - 1}, "
+                    f"actual value: {env_ids}"
+                )
+
+        if self._state not in (AsyncState.DEFAULT, AsyncState.WAITING_STEP) or any(
+            env_id in self._pending_env_ids for env_id in env_ids
+        ):
             raise AlreadyPendingCallError(
                 f"Calling `step_async` while waiting for a pending call to `{self._state.value}` to complete.",
                 self._state.value,
             )
 
-        actions = iterate(self.action_space, actions)
-        for pipe, action in zip(self.parent_pipes, actions):
-            pipe.send(("step", action))
+        if self._action_buffer is not None and self._can_share_actions(
+            actions, env_ids
+        ):
+            self._actions[env_ids] = actions
+            actions = [None for _ in env_ids]
+        else:
+            # Other actions are sent through the pipes, for the sub-environments to reject them as without shared memory
+            actions = list(iterate(self.action_space, actions))
+            if len(actions) != len(env_ids):
+                raise ValueError(
+                    f"Expected one action for each of the {len(env_ids)} sub-environments to step, "
+                    f"actual number of actions: {len(actions)}"
+                )
+        if env_ids == list(range(self.num_envs)):
+            self._send_to_workers("step", actions)
+        else:
+            for env_id, action in zip(env_ids, actions):
+                self.parent_pipes[env_id].send(("step", action))
+        self._pending_env_ids.extend(env_ids)
+        self._partial_step = self._partial_step or len(env_ids) != self.num_envs
         self._state = AsyncState.WAITING_STEP
 
+    def _can_share_actions(self, actions, env_ids: List[int]) -> bool:
+        """Checks if ``actions`` are integer actions, one for each of ``env_ids``, that can be written to the action buffer."""
+        actions = np.asarray(actions)
+        if (
+            actions.dtype.kind not in "iu"
+            or actions.shape != (len(env_ids),) + self.single_action_space.shape
+        ):
+            return False
+        elif len(env_ids) == self.num_envs:
+            return self.action_space.contains(actions)
+        return all(self.single_action_space.contains(action) for action in actions)
+
     def step_wait(
-        self, timeout: Optional[Union[int, float]] = None
+        self,
+        timeout: Optional[Union[int, float]] = None,
+        batch_size: Optional[int] = None,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[dict]]:
         """Wait for the calls to :obj:`step` in each sub-environment to finish.
 
+        When only some of the sub-environments are returned, either because ``batch_size`` is given or because
+        :meth:`step_async` was called with ``env_ids``, the batched results only contain these sub-environments,
+        ordered by index, and the info dictionary contains their indices under the ``"env_id"`` key.
+        If ``copy=False``, the observations of these batches share a buffer with the previous batches of the same size.
+
         Args:
             timeout: Number of seconds before the call to :meth:`step_wait` times out. If ``None``, the call to :meth:`step_wait` never times out.
+            batch_size: Number of pending sub-environments to wait for. Among the ones that have finished,
+                the ones that were stepped first are returned while the others remain pending. If ``None``, then all the pending sub-environments are waited for.
 
         Returns:
              The batched environment step information, (obs, reward, terminated, truncated, info)
@@ -300,6 +442,7 @@ class AsyncVectorEnv(VectorEnv):
             ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
             NoAsyncCallError: If :meth:`step_wait` was called without any prior call to :meth:`step_async`.
             TimeoutError: If :meth:`step_wait` timed out.
+            ValueError: If ``batch_size`` is larger than the number of pending sub-environments.
         """
         self._assert_is_running()
         if self._state != AsyncState.WAITING_STEP:
@@ -308,27 +451,106 @@ class AsyncVectorEnv(VectorEnv):
                 AsyncState.WAITING_STEP.value,
             )
 
-        if not self._poll(timeout):
+        if batch_size is None:
+            if not self._partial_step:
+                return self._step_wait_all(timeout)
+            batch_size = len(self._pending_env_ids)
+        elif self._grouped:
+            raise ValueError(
+                "Waiting for a subset of the environments with `batch_size` is not supported with `num_workers`."
+            )
+        elif not 0 < batch_size <= len(self._pending_env_ids):
+            raise ValueError(
+                f"Expected `batch_size` to be between 1 and the number of pending environments ({len(self._pending_env_ids)}), "
+                f"actual value: {batch_size}"
+            )
+        else:
+            # Once a subset is returned, the remaining pending sub-environments must be waited for individually
+            self._partial_step = True
+
+        env_ids = self._wait_for_envs(batch_size, timeout)
+        if env_ids is None:
             self._state = AsyncState.DEFAULT
+            self._pending_env_ids, self._partial_step = [], False
             raise mp.TimeoutError(
                 f"The call to `step_wait` has timed out after {timeout} second(s)."
             )
 
-        observations_list, rewards, terminateds, truncateds, infos = [], [], [], [], {}
-        successes = []
-        for i, pipe in enumerate(self.parent_pipes):
-            result, success = pipe.recv()
-            obs, rew, terminated, truncated, info = result
+        results, successes = zip(*[self.parent_pipes[i].recv() for i in env_ids])
+        # The returned sub-environments are no longer pending, even if some of them failed
+        self._pending_env_ids = [
+            env_id for env_id in self._pending_env_ids if env_id not in env_ids
+        ]
+        if len(self._pending_env_ids) == 0:
+            self._state = AsyncState.DEFAULT
+            self._partial_step = False
+        self._raise_if_errors(successes)
 
-            successes.append(success)
+        observations_list, infos = [], {}
+        for env_id, (obs, rew, terminated, truncated, info) in zip(env_ids, results):
             observations_list.append(obs)
-            rewards.append(rew)
-            terminateds.append(terminated)
-            truncateds.append(truncated)
-            infos = self._add_info(infos, info, i)
+            if self._step_buffers is None:
+                self._rewards[env_id] = rew
+                self._terminateds[env_id] = terminated
+                self._truncateds[env_id] = truncated
+            infos = self._add_info(infos, info, env_id)
+        infos = {key: value[env_ids] for key, value in infos.items()}
+        infos["env_id"] = np.array(env_ids)
+        infos["_env_id"] = np.ones(len(env_ids), dtype=np.bool_)
+
+        # Without copy, the batches are written in place into a buffer kept for each batch size
+        batch_observations = (
+            None if self.copy else self._batch_observations.get(len(env_ids))
+        )
+        if batch_observations is None:
+            batch_observations = create_empty_array(
+                self.single_observation_space, n=len(env_ids), fn=np.empty
+            )
+            if not self.copy:
+                self._batch_observations[len(env_ids)] = batch_observations
+        if self.shared_memory:
+            # Each component of the shared observations is gathered directly into its batch array
+            observations = take(
+                self.single_observation_space,
+                self.observations,
+                env_ids,
+                batch_observations,
+            )
+        else:
+            observations = concatenate(
+                self.single_observation_space, observations_list, batch_observations
+            )
 
-        self._raise_if_errors(successes)
+        return (
+            observations,
+            self._rewards[env_ids],
+            self._terminateds[env_ids],
+            self._truncateds[env_ids],
+            infos,
+        )
+
+    def _step_wait_all(self, timeout: Optional[Union[int, float]] = None):
+        """Waits for the step of all the sub-environments and returns the batched results."""
+        if not self._poll(timeout):
+            self._state = AsyncState.DEFAULT
+            self._pending_env_ids = []
+            raise mp.TimeoutError(
+                f"The call to `step_wait` has timed out after {timeout} second(s)."
+            )
+
+        results, successes = self._recv_from_workers()
         self._state = AsyncState.DEFAULT
+        self._pending_env_ids = []
+        self._raise_if_errors(successes)
+
+        observations_list, infos = [], {}
+        for i, (obs, rew, terminated, truncated, info) in enumerate(results):
+            observations_list.append(obs)
+            if self._step_buffers is None:
+                self._rewards[i] = rew
+                self._terminateds[i] = terminated
+                self._truncateds[i] = truncated
+            infos = self._add_info(infos, info, i)
 
         if not self.shared_memory:
             self.observations = concatenate(
@@ -339,12 +561,41 @@ class AsyncVectorEnv(VectorEnv):
 
         return (
             deepcopy(self.observations) if self.copy else self.observations,
-            np.array(rewards),
-            np.array(terminateds, dtype=np.bool_),
-            np.array(truncateds, dtype=np.bool_),
+            np.copy(self._rewards),
+            np.copy(self._terminateds),
+            np.copy(self._truncateds),
             infos,
         )
 
+    def _wait_for_envs(
+        self, batch_size: int, timeout: Optional[Union[int, float]] = None
+    ) -> Optional[List[int]]:
+        """Waits until ``batch_size`` of the pending sub-environments have sent their results.
+
+        Args:
+            batch_size: The number of sub-environments to wait for
+            timeout: Number of seconds before timing out. If ``None``, then this never times out.
+
+        Returns:
+            The sorted indices of the ``batch_size`` ready sub-environments that were stepped first,
+            or ``None`` if timed out
+        """
+        end_time = None if timeout is None else time.perf_counter() + timeout
+        pipe_to_env_id = {self.parent_pipes[i]: i for i in self._pending_env_ids}
+        ready = set()
+        while len(ready) < batch_size:
+            delta = None if end_time is None else end_time - time.perf_counter()
+            if delta is not None and delta <= 0:
+                return None
+            waiting = [
+                self.parent_pipes[i] for i in self._pending_env_ids if i not in ready
+            ]
+            for pipe in connection.wait(waiting, timeout=delta):
+                ready.add(pipe_to_env_id[pipe])
+        # The pending sub-environments are in the order they were stepped, so none of them is left behind
+        ready_env_ids = [env_id for env_id in self._pending_env_ids if env_id in ready]
+        return sorted(ready_env_ids[:batch_size])
+
     def call_async(self, name: str, *args, **kwargs):
         """Calls the method with name asynchronously and apply args and kwargs to the method.
 
@@ -365,8 +616,7 @@ class AsyncVectorEnv(VectorEnv):
                 self._state.value,
             )
 
-        for pipe in self.parent_pipes:
-            pipe.send(("_call", (name, args, kwargs)))
+        self._send_to_workers("_call", [(name, args, kwargs)] * self.num_envs)
         self._state = AsyncState.WAITING_CALL
 
     def call_wait(self, timeout: Optional[Union[int, float]] = None) -> list:
@@ -396,11 +646,11 @@ class AsyncVectorEnv(VectorEnv):
                 f"The call to `call_wait` has timed out after {timeout} second(s)."
             )
 
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        results, successes = self._recv_from_workers()
         self._raise_if_errors(successes)
         self._state = AsyncState.DEFAULT
 
-        return results
+        return tuple(results)
 
     def set_attr(self, name: str, values: Union[list, tuple, object]):
         """Sets an attribute of the sub-environments.
@@ -432,9 +682,8 @@ class AsyncVectorEnv(VectorEnv):
                 self._state.value,
             )
 
-        for pipe, value in zip(self.parent_pipes, values):
-            pipe.send(("_setattr", (name, value)))
-        _, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        self._send_to_workers("_setattr", [(name, value) for value in values])
+        _, successes = self._recv_from_workers()
         self._raise_if_errors(successes)
 
     def close_extras(
@@ -484,22 +733,24 @@ class AsyncVectorEnv(VectorEnv):
         self._assert_is_running()
         if timeout is None:
             return True
+        if any(pipe is None or pipe.closed for pipe in self.parent_pipes):
+            return False
+        # All the pipes are waited on at once, rather than polling them one after the other
         end_time = time.perf_counter() + timeout
-        delta = None
-        for pipe in self.parent_pipes:
+        waiting = list(self.parent_pipes)
+        while waiting:
             delta = max(end_time - time.perf_counter(), 0)
-            if pipe is None:
-                return False
-            if pipe.closed or (not pipe.poll(delta)):
+            ready = connection.wait(waiting, timeout=delta)
+            if not ready:
                 return False
+            waiting = [pipe for pipe in waiting if pipe not in ready]
         return True
 
     def _check_spaces(self):
         self._assert_is_running()
         spaces = (self.single_observation_space, self.single_action_space)
-        for pipe in self.parent_pipes:
-            pipe.send(("_check_spaces", spaces))
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        self._send_to_workers("_check_spaces", [spaces] * self.num_envs)
+        results, successes = self._recv_from_workers()
         self._raise_if_errors(successes)
         same_observation_spaces, same_action_spaces = zip(*results)
         if not all(same_observation_spaces):
@@ -515,6 +766,38 @@ class AsyncVectorEnv(VectorEnv):
                 "action spaces from all environments must be equal."
             )
 
+    def _send_to_workers(self, command: str, data: list):
+        """Sends a command to each worker, with the data of its sub-environments.
+
+        Args:
+            command: The command to send
+            data: The data for each sub-environment, in the order of the sub-environments
+        """
+        for pipe, env_indices in zip(self.parent_pipes, self._worker_env_indices):
+            if self._grouped:
+                pipe.send((command, [data[i] for i in env_indices]))
+            else:
+                pipe.send((command, data[env_indices[0]]))
+
+    def _recv_from_workers(self) -> Tuple[list, List[bool]]:
+        """Receives the results of a command from each worker.
+
+        Returns:
+            The results for each sub-environment, in the order of the sub-environments (``None`` for
+            the sub-environments of a failed worker), and the success of each worker
+        """
+        results, successes = [], []
+        for pipe, env_indices in zip(self.parent_pipes, self._worker_env_indices):
+            result, success = pipe.recv()
+            successes.append(success)
+            if not success:
+                results.extend([None] * len(env_indices))
+            elif self._grouped:
+                results.extend(result)
+            else:
+                results.append(result)
+        return results, successes
+
     def _assert_is_running(self):
         if self.closed:
             raise ClosedEnvironmentError(
@@ -525,7 +808,7 @@ class AsyncVectorEnv(VectorEnv):
         if all(successes):
             return
 
-        num_errors = self.num_envs - sum(successes)
+        num_errors = len(successes) - sum(successes)
         assert num_errors > 0
         for i in range(num_errors):
             index, exctype, value = self.error_queue.get()
@@ -613,10 +896,34 @@ def _worker(index, env_fn, pipe, parent_pipe, shared_memory, error_queue):
         env.close()
 
 
-def _worker_shared_memory(index, env_fn, pipe, parent_pipe, shared_memory, error_queue):
+def _read_step_buffers(step_buffers):
+    """Returns numpy views of the shared rewards, terminations and truncations buffers."""
+    rewards, terminateds, truncateds = step_buffers
+    return (
+        np.frombuffer(rewards.get_obj(), dtype=np.float64),
+        np.frombuffer(terminateds.get_obj(), dtype=np.bool_),
+        np.frombuffer(truncateds.get_obj(), dtype=np.bool_),
+    )
+
+
+def _worker_shared_memory(
+    index,
+    env_fn,
+    pipe,
+    parent_pipe,
+    shared_memory,
+    error_queue,
+    step_buffers=None,
+    action_buffer=None,
+    num_envs=None,
+):
     assert shared_memory is not None
     env = env_fn()
     observation_space = env.observation_space
+    if step_buffers is not None:
+        rewards, terminateds, truncateds = _read_step_buffers(step_buffers)
+    if action_buffer is not None:
+        actions = read_from_shared_memory(env.action_space, action_buffer, n=num_envs)
     parent_pipe.close()
     try:
         while True:
@@ -629,13 +936,11 @@ def _worker_shared_memory(index, env_fn, pipe, parent_pipe, shared_memory, error
                 pipe.send(((None, info), True))
 
             elif command == "step":
-                (
-                    observation,
-                    reward,
-                    terminated,
-                    truncated,
-                    info,
-                ) = env.step(data)
+                (observation, reward, terminated, truncated, info,) = env.step(
+                    actions[index].copy()
+                    if data is None and action_buffer is not None
+                    else data
+                )
                 if terminated or truncated:
                     old_observation, old_info = observation, info
                     observation, info = env.reset()
@@ -644,7 +949,13 @@ def _worker_shared_memory(index, env_fn, pipe, parent_pipe, shared_memory, error
                 write_to_shared_memory(
                     observation_space, index, observation, shared_memory
                 )
-                pipe.send(((None, reward, terminated, truncated, info), True))
+                if step_buffers is not None:
+                    rewards[index] = reward
+                    terminateds[index] = terminated
+                    truncateds[index] = truncated
+                    pipe.send(((None, None, None, None, info), True))
+                else:
+                    pipe.send(((None, reward, terminated, truncated, info), True))
             elif command == "seed":
                 env.seed(data)
                 pipe.send((None, True))
@@ -682,3 +993,119 @@ def _worker_shared_memory(index, env_fn, pipe, parent_pipe, shared_memory, error
         pipe.send((None, False))
     finally:
         env.close()
+
+
+def _worker_group(
+    index,
+    env_fns,
+    pipe,
+    parent_pipe,
+    shared_memory,
+    error_queue,
+    env_indices=None,
+    step_buffers=None,
+    action_buffer=None,
+    num_envs=None,
+):
+    assert env_indices is not None and len(env_fns) == len(env_indices)
+    envs = [env_fn() for env_fn in env_fns]
+    observation_space = envs[0].observation_space
+    if step_buffers is not None:
+        rewards, terminateds, truncateds = _read_step_buffers(step_buffers)
+    if action_buffer is not None:
+        actions = read_from_shared_memory(
+            envs[0].action_space, action_buffer, n=num_envs
+        )
+    parent_pipe.close()
+    try:
+        while True:
+            command, data = pipe.recv()
+            if command == "reset":
+                results = []
+                for env_index, env, kwargs in zip(env_indices, envs, data):
+                    observation, info = env.reset(**kwargs)
+                    if shared_memory is not None:
+                        write_to_shared_memory(
+                            observation_space, env_index, observation, shared_memory
+                        )
+                        observation = None
+                    results.append((observation, info))
+                pipe.send((results, True))
+            elif command == "step":
+                results = []
+                for env_index, env, action in zip(env_indices, envs, data):
+                    if action is None and action_buffer is not None:
+                        action = actions[env_index].copy()
+                    (
+                        observation,
+                        reward,
+                        terminated,
+                        truncated,
+                        info,
+                    ) = env.step(action)
+                    if terminated or truncated:
+                        old_observation, old_info = observation, info
+                        observation, info = env.reset()
+                        info["final_observation"] = old_observation
+                        info["final_info"] = old_info
+                    if shared_memory is not None:
+                        write_to_shared_memory(
+                            observation_space, env_index, observation, shared_memory
+                        )
+                        observation = None
+                    if step_buffers is not None:
+                        rewards[env_index] = reward
+                        terminateds[env_index] = terminated
+                        truncateds[env_index] = truncated
+                        reward = terminated = truncated = None
+                    results.append((observation, reward, terminated, truncated, info))
+                pipe.send((results, True))
+            elif command == "close":
+                pipe.send((None, True))
+                break
+            elif command == "_call":
+                results = []
+                for env, (name, args, kwargs) in zip(envs, data):
+                    if name in ["reset", "step", "seed", "close"]:
+                        raise ValueError(
+                            f"Trying to call function `{name}` with "
+                            f"`_call`. Use `{name}` directly instead."
+                        )
+                    function = getattr(env, name)
+                    if callable(function):
+                        results.append(function(*args, **kwargs))
+                    else:
+                        results.append(function)
+                pipe.send((results, True))
+            elif command == "_setattr":
+                for env, (name, value) in zip(envs, data):
+                    setattr(env, name, value)
+                pipe.send(([None] * len(envs), True))
+            elif command == "_check_spaces":
+                pipe.send(
+                    (
+                        [
+                            (
+                                single_observation_space == env.observation_space,
+                                single_action_space == env.action_space,
+                            )
+                            for env, (
+                                single_observation_space,
+                                single_action_space,
+                            ) in zip(envs, data)
+                        ],
+                        True,
+                    )
+                )
+            else:
+                raise RuntimeError(
+                    f"Received unknown command `{command}`. Must "
+                    "be one of {`reset`, `step`, `close`, `_call`, "
+                    "`_setattr`, `_check_spaces`}."
+                )
+    except (KeyboardInterrupt, Exception):
+        error_queue.put((index,) + sys.exc_info()[:2])
+        pipe.send((None, False))
+    finally:
+        for env in envs:
+            env.close()
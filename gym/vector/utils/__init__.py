@@ -1,6 +1,6 @@
 """Module for gym vector utils."""
 from gym.vector.utils.misc import CloudpickleWrapper, clear_mpi_env_vars
-from gym.vector.utils.numpy_utils import concatenate, create_empty_array
+from gym.vector.utils.numpy_utils import concatenate, create_empty_array, take
 from gym.vector.utils.shared_memory import (
     create_shared_memory,
     read_from_shared_memory,
@@ -14,6 +14,7 @@ __all__ = [
     "clear_mpi_env_vars",
     "concatenate",
     "create_empty_array",
+    "take",
     "create_shared_memory",
     "read_from_shared_memory",
     "write_to_shared_memory",
@@ -1,13 +1,13 @@
-"""Numpy utility functions: concatenate space samples and create empty array."""
+"""Numpy utility functions: concatenate space samples, take samples from a batch and create empty array."""
 from collections import OrderedDict
 from functools import singledispatch
-from typing import Iterable, Union
+from typing import Iterable, Sequence, Union
 
 import numpy as np
 
 from gym.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete, Space, Tuple
 
-__all__ = ["concatenate", "create_empty_array"]
+__all__ = ["concatenate", "take", "create_empty_array"]
 
 
 @singledispatch
@@ -73,6 +73,74 @@ def _concatenate_custom(space, items, out):
     return tuple(items)
 
 
+@singledispatch
+def take(
+    space: Space,
+    items: Union[tuple, dict, np.ndarray],
+    indices: Sequence[int],
+    out: Union[tuple, dict, np.ndarray],
+) -> Union[tuple, dict, np.ndarray]:
+    """Take the samples at some indices of a batch of samples from space, into a smaller batch.
+
+    Example::
+
+        >>> from gym.spaces import Box
+        >>> space = Box(low=0, high=1, shape=(2,), dtype=np.float32)
+        >>> items = np.arange(8, dtype=np.float32).reshape(4, 2)
+        >>> out = np.zeros((2, 2), dtype=np.float32)
+        >>> take(space, items, [1, 3], out)
+        array([[2., 3.],
+               [6., 7.]], dtype=float32)
+
+    Args:
+        space: Observation space of a single environment in the vectorized environment.
+        items: Batch of samples to take from. This object is a (possibly nested) numpy array.
+        indices: Indices of the samples to take. These are expected to be valid indices in the batch.
+        out: The output object. This object is a (possibly nested) numpy array.
+
+    Returns:
+        The output object. This object is a (possibly nested) numpy array.
+
+    Raises:
+        ValueError: Space is not a valid :class:`gym.Space` instance
+    """
+    raise ValueError(
+        f"Space of type `{type(space)}` is not a valid `gym.Space` instance."
+    )
+
+
+@take.register(Box)
+@take.register(Discrete)
+@take.register(MultiDiscrete)
+@take.register(MultiBinary)
+def _take_base(space, items, indices, out):
+    # With `mode="raise"`, numpy would take into a temporary buffer before copying it into `out`
+    return np.take(items, indices, axis=0, out=out, mode="clip")
+
+
+@take.register(Tuple)
+def _take_tuple(space, items, indices, out):
+    return tuple(
+        take(subspace, items[i], indices, out[i])
+        for (i, subspace) in enumerate(space.spaces)
+    )
+
+
+@take.register(Dict)
+def _take_dict(space, items, indices, out):
+    return OrderedDict(
+        [
+            (key, take(subspace, items[key], indices, out[key]))
+            for (key, subspace) in space.spaces.items()
+        ]
+    )
+
+
+@take.register(Space)
+def _take_custom(space, items, indices, out):
+    return tuple(items[index] for index in indices)
+
+
 @singledispatch
 def create_empty_array(
     space: Space, n: int = 1, fn: callable = np.zeros
@@ -166,7 +166,7 @@ def _write_base_to_shared_memory(space, index, value, shared_memory):
     destination = np.frombuffer(shared_memory.get_obj(), dtype=space.dtype)
     np.copyto(
         destination[index * size : (index + 1) * size],
-        np.asarray(value, dtype=space.dtype).flatten(),
+        np.asarray(value, dtype=space.dtype).ravel(),
     )
 
 
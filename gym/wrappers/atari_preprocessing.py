@@ -98,6 +98,16 @@ class AtariPreprocessing(gym.Wrapper):
                 np.empty(env.observation_space.shape, dtype=np.uint8),
             ]
 
+        # the resized frame is only an intermediate when scaling, so it is written into a reused buffer
+        if scale_obs:
+            self.resize_buffer = np.empty(
+                (screen_size, screen_size)
+                + self.obs_buffer[0].shape[2:],  # channel axis, if any
+                dtype=np.uint8,
+            )
+        else:
+            self.resize_buffer = None
+
         self.lives = 0
         self.game_over = False
 
@@ -177,11 +187,12 @@ class AtariPreprocessing(gym.Wrapper):
         obs = cv2.resize(
             self.obs_buffer[0],
             (self.screen_size, self.screen_size),
+            dst=self.resize_buffer,
             interpolation=cv2.INTER_AREA,
         )
 
         if self.scale_obs:
-            obs = np.asarray(obs, dtype=np.float32) / 255.0
+            obs = np.divide(obs, np.float32(255.0), dtype=np.float32)
         else:
             obs = np.asarray(obs, dtype=np.uint8)
 
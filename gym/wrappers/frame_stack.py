@@ -56,7 +56,7 @@ class LazyFrames:
         """
         arr = self[:]
         if dtype is not None:
-            return arr.astype(dtype)
+            return arr.astype(dtype, copy=False)
         return arr
 
     def __len__(self):
@@ -76,7 +76,7 @@ class NormalizeObservation(gym.core.Wrapper):
         if self.is_vector_env:
             obs = self.normalize(obs)
         else:
-            obs = self.normalize(np.array([obs]))[0]
+            obs = self.normalize(np.expand_dims(obs, axis=0))[0]
         return obs, rews, terminateds, truncateds, infos
 
     def reset(self, **kwargs):
@@ -86,7 +86,7 @@ class NormalizeObservation(gym.core.Wrapper):
         if self.is_vector_env:
             return self.normalize(obs), info
         else:
-            return self.normalize(np.array([obs]))[0], info
+            return self.normalize(np.expand_dims(obs, axis=0))[0], info
 
     def normalize(self, obs):
         """Normalises the observation using the running mean and variance of the observations."""
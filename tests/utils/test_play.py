@@ -140,6 +140,28 @@ def test_keyboard_keyup_event():
     assert game.pressed_keys == []
 
 
+def test_keyboard_repeated_keydown_event():
+    env = PlayableEnv(render_mode="rgb_array")
+    game = PlayableGame(env, dummy_keys_to_action())
+    event = Event(pygame.KEYDOWN, {"key": RELEVANT_KEY_1})
+    game.process_event(event)
+    game.process_event(event)
+    assert game.pressed_keys == [RELEVANT_KEY_1]
+    event = Event(pygame.KEYUP, {"key": RELEVANT_KEY_1})
+    game.process_event(event)
+    assert game.pressed_keys == []
+
+
+def test_keyboard_keyup_event_without_keydown():
+    env = PlayableEnv(render_mode="rgb_array")
+    game = PlayableGame(env, dummy_keys_to_action())
+    event = Event(pygame.KEYDOWN, {"key": RELEVANT_KEY_2})
+    game.process_event(event)
+    event = Event(pygame.KEYUP, {"key": RELEVANT_KEY_1})
+    game.process_event(event)
+    assert game.pressed_keys == [RELEVANT_KEY_2]
+
+
 def test_play_loop_real_env():
     SEED = 42
     ENV = "CartPole-v1"
@@ -1,12 +1,14 @@
 import re
+import time
 from multiprocessing import TimeoutError
 
 import numpy as np
 import pytest
 
 from gym.error import AlreadyPendingCallError, ClosedEnvironmentError, NoAsyncCallError
-from gym.spaces import Box, Discrete, MultiDiscrete, Tuple
+from gym.spaces import Box, Discrete, MultiBinary, MultiDiscrete, Tuple
 from gym.vector.async_vector_env import AsyncVectorEnv
+from tests.testing_env import GenericTestEnv
 from tests.vector.utils import (
     CustomSpace,
     make_custom_space_env,
@@ -306,3 +308,279 @@ def test_custom_space_async_vector_env_shared_memory():
     with pytest.raises(ValueError):
         env = AsyncVectorEnv(env_fns, shared_memory=True)
         env.close(terminate=True)
+
+
+def test_shared_memory_step_results_async_vector_env():
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    actions = np.array([0, 1, 1, 0])
+
+    results = []
+    for shared_memory in [True, False]:
+        env = AsyncVectorEnv(env_fns, shared_memory=shared_memory)
+        env.reset(seed=123)
+        for _ in range(20):
+            results.append(env.step(actions)[:4])
+        env.close()
+
+    for shared_results, pipe_results in zip(results[:20], results[20:]):
+        for shared, pipe in zip(shared_results, pipe_results):
+            assert shared.dtype == pipe.dtype
+            assert np.all(shared == pipe)
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+@pytest.mark.parametrize("num_workers", [1, 3, 5])
+def test_num_workers_async_vector_env(shared_memory, num_workers):
+    env_fns = [make_env("CartPole-v1", i) for i in range(5)]
+    actions = np.array([0, 1, 1, 0, 1])
+
+    env = AsyncVectorEnv(env_fns, shared_memory=shared_memory)
+    grouped_env = AsyncVectorEnv(
+        env_fns, shared_memory=shared_memory, num_workers=num_workers
+    )
+    assert len(grouped_env.processes) == num_workers
+
+    observations, _ = env.reset(seed=123)
+    grouped_observations, _ = grouped_env.reset(seed=123)
+    assert np.all(observations == grouped_observations)
+    for _ in range(20):
+        results = env.step(actions)
+        grouped_results = grouped_env.step(actions)
+        for result, grouped_result in zip(results[:4], grouped_results[:4]):
+            assert np.all(result == grouped_result)
+
+    grouped_env.set_attr("gravity", [9.81, 3.72, 8.87, 1.62, 24.79])
+    assert grouped_env.get_attr("gravity") == (9.81, 3.72, 8.87, 1.62, 24.79)
+
+    env.close()
+    grouped_env.close()
+
+
+@pytest.mark.parametrize("num_workers", [0, 5])
+def test_invalid_num_workers_async_vector_env(num_workers):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    with pytest.raises(ValueError):
+        AsyncVectorEnv(env_fns, num_workers=num_workers)
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_step_batch_size_async_vector_env(shared_memory):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(env_fns, shared_memory=shared_memory)
+    env.reset()
+    env.step_async(np.array([0, 1, 0, 1]))
+    observations, rewards, terminateds, truncateds, infos = env.step_wait(batch_size=2)
+    first_env_ids = infos["env_id"]
+    assert len(set(first_env_ids)) == 2 and np.all(np.diff(first_env_ids) > 0)
+    assert observations.shape == (2,) + env.single_observation_space.shape
+    assert rewards.shape == terminateds.shape == truncateds.shape == (2,)
+
+    # Without `batch_size`, only the remaining pending sub-environments are waited for
+    observations, rewards, terminateds, truncateds, infos = env.step_wait(timeout=3)
+    assert sorted(set(first_env_ids) | set(infos["env_id"])) == [0, 1, 2, 3]
+    assert observations.shape == (2,) + env.single_observation_space.shape
+
+    with pytest.raises(NoAsyncCallError):
+        env.step_wait()
+
+    # The sub-environments that have been returned can be stepped again
+    env.step_async(np.array([0, 1, 0, 1]))
+    _, _, _, _, infos = env.step_wait(batch_size=1)
+    (returned_env_id,) = infos["env_id"]
+    with pytest.raises(AlreadyPendingCallError):
+        env.step_async(np.array([0]), env_ids=[(returned_env_id + 1) % 4])
+    env.step_async(np.array([0]), env_ids=[returned_env_id])
+    observations, _, _, _, infos = env.step_wait(timeout=3)
+    assert np.all(infos["env_id"] == [0, 1, 2, 3])
+    assert observations.shape == (4,) + env.single_observation_space.shape
+
+    env.step_async(np.array([0, 0]), env_ids=[0, 2])
+    with pytest.raises(ValueError):
+        env.step_wait(batch_size=3)
+    env.close()
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_step_permuted_env_ids_async_vector_env(shared_memory):
+    actions = np.array([0, 0, 1, 1])
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(env_fns, shared_memory=shared_memory)
+    env.reset(seed=123)
+    expected_observations, *_ = env.step(actions)
+
+    env.reset(seed=123)
+    env.step_async(actions[::-1], env_ids=[3, 2, 1, 0])
+    observations, *_ = env.step_wait(timeout=3)
+    env.close()
+
+    assert np.all(observations == expected_observations)
+
+
+@pytest.mark.parametrize("env_ids", [[0, 0], [1, 4], [-1]])
+def test_step_invalid_env_ids_async_vector_env(env_ids):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(env_fns)
+    env.reset()
+    with pytest.raises(ValueError):
+        env.step_async(np.zeros(len(env_ids), dtype=np.int64), env_ids=env_ids)
+    env.close()
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_step_number_of_actions_async_vector_env(shared_memory):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(env_fns, shared_memory=shared_memory)
+    env.reset()
+    with pytest.raises(ValueError):
+        env.step_async(np.zeros(4, dtype=np.int64), env_ids=[0, 1])
+    with pytest.raises(ValueError):
+        env.step_async(np.array([0, 1]))
+
+    # No step was sent to the sub-environments
+    observations, *_ = env.step(np.zeros(4, dtype=np.int64))
+    assert observations.shape == (4,) + env.single_observation_space.shape
+    env.close()
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_step_batch_size_loop_async_vector_env(shared_memory):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(env_fns, shared_memory=shared_memory)
+    env.reset()
+    env.step_async(np.zeros(4, dtype=np.int64))
+    returned_env_ids = []
+    for _ in range(8):
+        time.sleep(0.01)
+        _, _, _, _, infos = env.step_wait(timeout=3, batch_size=2)
+        returned_env_ids.extend(infos["env_id"])
+        env.step_async(np.zeros(2, dtype=np.int64), env_ids=infos["env_id"])
+    env.step_wait(timeout=3)
+    env.close()
+
+    # All the sub-environments are returned in turn, none of them is starved
+    assert np.all(np.bincount(returned_env_ids, minlength=4) == 4)
+
+
+def _raise_step_fn(self, action):
+    raise ValueError("Step error")
+
+
+@pytest.mark.parametrize(
+    "num_workers, env_ids", [(None, None), (None, [0, 1]), (2, None)]
+)
+def test_step_error_close_async_vector_env(num_workers, env_ids):
+    env_fns = [GenericTestEnv for _ in range(4)]
+    env_fns[1] = lambda: GenericTestEnv(step_fn=_raise_step_fn)
+
+    env = AsyncVectorEnv(env_fns, num_workers=num_workers)
+    env.reset()
+    actions = np.zeros((4 if env_ids is None else len(env_ids), 1), dtype=np.float32)
+    env.step_async(actions, env_ids=env_ids)
+    with pytest.raises(ValueError, match="Step error"):
+        env.step_wait(timeout=3)
+    env.close()
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+@pytest.mark.parametrize("copy", [True, False])
+def test_step_batch_size_copy_async_vector_env(shared_memory, copy):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(env_fns, shared_memory=shared_memory, copy=copy)
+    env.reset(seed=123)
+    env.step_async(np.array([0, 1]), env_ids=[0, 1])
+    first_observations, *_ = env.step_wait()
+    env.step_async(np.array([1, 0]), env_ids=[2, 3])
+    second_observations, *_ = env.step_wait()
+    env.close()
+
+    assert (first_observations is second_observations) is not copy
+
+
+def test_step_batch_size_tuple_observations_async_vector_env():
+    batches = []
+    for shared_memory in [True, False]:
+        env_fns = [make_env("Blackjack-v1", i) for i in range(4)]
+        env = AsyncVectorEnv(env_fns, shared_memory=shared_memory)
+        env.reset(seed=123)
+        env.step_async(np.array([0, 1]), env_ids=[1, 3])
+        observations, *_ = env.step_wait()
+        env.close()
+
+        assert isinstance(observations, tuple)
+        assert len(observations) == len(env.single_observation_space.spaces)
+        assert all(obs.shape == (2,) for obs in observations)
+        batches.append(observations)
+
+    assert all(np.all(a == b) for a, b in zip(*batches))
+
+
+def _action_step_fn(self, action):
+    assert self.action_space.contains(action), action
+    return np.array(action, dtype=self.observation_space.dtype), 0, False, False, {}
+
+
+def make_action_env(action_space):
+    def _make():
+        return GenericTestEnv(
+            action_space=action_space,
+            observation_space=action_space,
+            step_fn=_action_step_fn,
+        )
+
+    return _make
+
+
+@pytest.mark.parametrize(
+    "action_space", [MultiDiscrete([3, 4]), MultiBinary(3)], ids=repr
+)
+@pytest.mark.parametrize("num_workers", [None, 2])
+def test_shared_memory_actions_async_vector_env(action_space, num_workers):
+    env_fns = [make_action_env(action_space) for _ in range(4)]
+    actions = np.stack([action_space.sample() for _ in range(4)])
+
+    for shared_memory in [True, False]:
+        env = AsyncVectorEnv(
+            env_fns, shared_memory=shared_memory, num_workers=num_workers
+        )
+        env.reset()
+        observations, *_ = env.step(actions)
+        env.close()
+
+        assert np.all(observations == actions)
+
+
+@pytest.mark.parametrize(
+    "action_space", [Discrete(3), MultiDiscrete([3, 4]), MultiBinary(3)], ids=repr
+)
+def test_shared_memory_actions_env_ids_async_vector_env(action_space):
+    env_fns = [make_action_env(action_space) for _ in range(4)]
+    actions = np.stack([action_space.sample() for _ in range(2)])
+
+    env = AsyncVectorEnv(env_fns, shared_memory=True)
+    env.reset()
+    env.step_async(actions, env_ids=[3, 1])
+    # The actions of a subset of the sub-environments are also written to the shared buffer
+    assert np.all(env._actions[[3, 1]] == actions)
+    observations, *_ = env.step_wait(timeout=3)
+    env.close()
+
+    assert np.all(observations == actions[::-1])
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+@pytest.mark.parametrize("num_workers", [None, 2])
+def test_float_discrete_actions_async_vector_env(shared_memory, num_workers):
+    env_fns = [make_env("CartPole-v1", i) for i in range(2)]
+
+    env = AsyncVectorEnv(env_fns, shared_memory=shared_memory, num_workers=num_workers)
+    env.reset()
+    # Float actions are not truncated into the shared action buffer
+    with pytest.raises(AssertionError):
+        env.step(np.array([0.9, 1.7]))
+    env.close(terminate=True)
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 
 from gym.spaces import Dict, Tuple
-from gym.vector.utils.numpy_utils import concatenate, create_empty_array
+from gym.vector.utils.numpy_utils import concatenate, create_empty_array, take
 from gym.vector.utils.spaces import BaseGymSpaces
 from tests.vector.utils import spaces
 
@@ -51,6 +51,36 @@ def test_concatenate(space):
     assert_nested_equal(array, samples, n=8)
 
 
+@pytest.mark.parametrize(
+    "space", spaces, ids=[space.__class__.__name__ for space in spaces]
+)
+def test_take(space):
+    samples = [space.sample() for _ in range(8)]
+    items = concatenate(space, samples, create_empty_array(space, n=8))
+    indices = [6, 1, 3]
+    expected = concatenate(
+        space, [samples[i] for i in indices], create_empty_array(space, n=3)
+    )
+
+    array = create_empty_array(space, n=3, fn=np.empty)
+    taken = take(space, items, indices, array)
+
+    def assert_nested_equal(lhs, rhs):
+        if isinstance(lhs, np.ndarray):
+            assert np.all(lhs == rhs)
+        elif isinstance(lhs, tuple):
+            for i in range(len(lhs)):
+                assert_nested_equal(lhs[i], rhs[i])
+        elif isinstance(lhs, OrderedDict):
+            for key in lhs.keys():
+                assert_nested_equal(lhs[key], rhs[key])
+        else:
+            raise TypeError(f"Got unknown type `{type(lhs)}`.")
+
+    assert_nested_equal(taken, expected)
+    assert_nested_equal(array, expected)
+
+
 @pytest.mark.parametrize("n", [1, 8])
 @pytest.mark.parametrize(
     "space", spaces, ids=[space.__class__.__name__ for space in spaces]